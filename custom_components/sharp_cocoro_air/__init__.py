@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 
+from .command_queue import STORAGE_VERSION, storage_key
 from .const import PLATFORMS
 from .coordinator import SharpCocoroAirCoordinator
 
@@ -34,3 +36,10 @@ async def async_unload_entry(
 ) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: SharpCocoroAirConfigEntry,
+) -> None:
+    """Delete the persisted command queue when the entry is removed."""
+    await Store(hass, STORAGE_VERSION, storage_key(entry.entry_id)).async_remove()
@@ -0,0 +1,158 @@
+"""Persistent offline command queue for Sharp COCORO Air."""
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 1
+
+# Maps library command name -> intent it sets. A newer command for the
+# same intent replaces the queued one (e.g. power_off supersedes power_on).
+COMMAND_INTENTS = {
+    "power_on": "power",
+    "power_off": "power",
+    "set_mode": "mode",
+    "set_humidify": "humidify",
+}
+
+
+def storage_key(entry_id: str) -> str:
+    """Return the storage key holding the queue of a config entry."""
+    return f"{DOMAIN}.{entry_id}.command_queue"
+
+
+@dataclasses.dataclass(frozen=True)
+class QueuedCommand:
+    """A control command waiting to be sent to the Sharp cloud."""
+
+    command: str
+    args: tuple[Any, ...]
+    queued_at: datetime
+
+    @property
+    def intent(self) -> str:
+        """Return the device state this command sets."""
+        return COMMAND_INTENTS[self.command]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "command": self.command,
+            "args": list(self.args),
+            "queued_at": self.queued_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QueuedCommand:
+        """Restore a command saved with as_dict()."""
+        return cls(
+            command=data["command"],
+            args=tuple(data["args"]),
+            queued_at=dt_util.parse_datetime(data["queued_at"]) or dt_util.utcnow(),
+        )
+
+
+class CommandQueue:
+    """Per-device FIFO of undelivered commands, persisted to storage.
+
+    Each device holds at most one command per intent; queueing a command
+    drops the older one for the same intent and appends the new one, so
+    replay order follows the user's latest actions.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, storage_key(entry_id)
+        )
+        self._commands: dict[str, list[QueuedCommand]] = {}
+        self._last_error: dict[str, str] = {}
+        self._next_retry: dict[str, datetime] = {}
+
+    async def async_load(self) -> None:
+        """Load queued commands from storage."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for device_id, commands in stored.get("commands", {}).items():
+            queued = [
+                QueuedCommand.from_dict(cmd)
+                for cmd in commands
+                if cmd.get("command") in COMMAND_INTENTS
+            ]
+            if queued:
+                self._commands[device_id] = queued
+
+    def device_ids(self) -> list[str]:
+        """Return devices with pending commands."""
+        return list(self._commands)
+
+    def pending(self, device_id: str) -> list[QueuedCommand]:
+        """Return the pending commands of a device, oldest first."""
+        return list(self._commands.get(device_id, ()))
+
+    def enqueue(self, device_id: str, command: str, args: tuple[Any, ...]) -> None:
+        """Queue a command, replacing any pending one with the same intent."""
+        new = QueuedCommand(command, args, dt_util.utcnow())
+        commands = [
+            cmd for cmd in self._commands.get(device_id, ())
+            if cmd.intent != new.intent
+        ]
+        commands.append(new)
+        self._commands[device_id] = commands
+        self._async_schedule_save()
+
+    def peek(self, device_id: str) -> QueuedCommand | None:
+        """Return the oldest pending command of a device."""
+        commands = self._commands.get(device_id)
+        return commands[0] if commands else None
+
+    def remove(self, device_id: str, command: QueuedCommand) -> None:
+        """Remove a command, unless a newer one has already superseded it.
+
+        Matches by identity: while a command is being sent, enqueue() may
+        replace the device's list, so its position is not reliable.
+        """
+        commands = self._commands.get(device_id)
+        if not commands or not any(cmd is command for cmd in commands):
+            return
+        commands = [cmd for cmd in commands if cmd is not command]
+        if commands:
+            self._commands[device_id] = commands
+        else:
+            del self._commands[device_id]
+            self._last_error.pop(device_id, None)
+            self._next_retry.pop(device_id, None)
+        self._async_schedule_save()
+
+    def note_failure(self, error: str, next_retry: datetime) -> None:
+        """Record a failed replay for every device with pending commands."""
+        for device_id in self._commands:
+            self._last_error[device_id] = error
+            self._next_retry[device_id] = next_retry
+
+    def last_error(self, device_id: str) -> str | None:
+        """Return the last replay error of a device with pending commands."""
+        return self._last_error.get(device_id)
+
+    def next_retry(self, device_id: str) -> datetime | None:
+        """Return when replay is next attempted for a device."""
+        return self._next_retry.get(device_id)
+
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "commands": {
+                device_id: [cmd.as_dict() for cmd in commands]
+                for device_id, commands in self._commands.items()
+            }
+        }
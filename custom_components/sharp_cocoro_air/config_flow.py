@@ -10,13 +10,23 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFl
 
 from aiosharp_cocoro_air import SharpAuthError, SharpCOCOROAir, SharpConnectionError
 from .const import (
+    CONF_COMMAND_QUEUE,
+    CONF_COMMAND_TIMEOUT,
     CONF_EMAIL,
+    CONF_HEDGE_READS,
     CONF_PASSWORD,
+    CONF_READ_TIMEOUT,
     CONF_SCAN_INTERVAL,
+    DEFAULT_COMMAND_QUEUE,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_HEDGE_READS,
+    DEFAULT_READ_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MAX_SCAN_INTERVAL,
+    MAX_TIMEOUT,
     MIN_SCAN_INTERVAL,
+    MIN_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -121,18 +131,40 @@ class SharpCocoroAirOptionsFlow(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        current = self._config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-        )
+        options = self._config_entry.options
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Required(
                     CONF_SCAN_INTERVAL,
-                    default=current,
+                    default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                 ): vol.All(
                     int,
                     vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                 ),
+                vol.Required(
+                    CONF_READ_TIMEOUT,
+                    default=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+                ): vol.All(
+                    int,
+                    vol.Range(min=MIN_TIMEOUT, max=MAX_TIMEOUT),
+                ),
+                vol.Required(
+                    CONF_COMMAND_TIMEOUT,
+                    default=options.get(
+                        CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT
+                    ),
+                ): vol.All(
+                    int,
+                    vol.Range(min=MIN_TIMEOUT, max=MAX_TIMEOUT),
+                ),
+                vol.Required(
+                    CONF_HEDGE_READS,
+                    default=options.get(CONF_HEDGE_READS, DEFAULT_HEDGE_READS),
+                ): bool,
+                vol.Required(
+                    CONF_COMMAND_QUEUE,
+                    default=options.get(CONF_COMMAND_QUEUE, DEFAULT_COMMAND_QUEUE),
+                ): bool,
             }),
         )
@@ -12,6 +12,22 @@ DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 15
 MAX_SCAN_INTERVAL = 300
 
+# Per-call deadlines (seconds) for reads (login, device list) and commands
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_COMMAND_TIMEOUT = "command_timeout"
+DEFAULT_READ_TIMEOUT = 20
+DEFAULT_COMMAND_TIMEOUT = 15
+MIN_TIMEOUT = 5
+MAX_TIMEOUT = 60
+
+# Send a second, parallel device list request when the first one is slow
+CONF_HEDGE_READS = "hedge_reads"
+DEFAULT_HEDGE_READS = False
+
+# Queue commands that cannot reach the cloud and replay them on reconnect
+CONF_COMMAND_QUEUE = "command_queue"
+DEFAULT_COMMAND_QUEUE = False
+
 # Maps API mode key -> display name
 OPERATION_MODES = {
     "auto": "Auto",
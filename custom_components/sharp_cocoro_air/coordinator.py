@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import dataclasses
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 
 from aiosharp_cocoro_air import (
@@ -19,19 +23,44 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .command_queue import CommandQueue
 
 from .const import (
+    CONF_COMMAND_QUEUE,
+    CONF_COMMAND_TIMEOUT,
     CONF_EMAIL,
+    CONF_HEDGE_READS,
     CONF_PASSWORD,
+    CONF_READ_TIMEOUT,
     CONF_SCAN_INTERVAL,
+    DEFAULT_COMMAND_QUEUE,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_HEDGE_READS,
+    DEFAULT_READ_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     OPERATION_MODES,
 )
+from .latency import LatencyTracker
 
 STARTUP_RETRIES = 3
 STARTUP_RETRY_DELAY = 10
 
+# Bounded retries for idempotent reads (full jitter exponential backoff)
+READ_RETRIES = 2
+READ_RETRY_BASE_DELAY = 1.0
+
+# Hedge a read once it runs longer than this percentile of recent reads
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20
+
+# Offline command replay backoff (seconds) and max age of a queued command
+REPLAY_BASE_DELAY = 5
+REPLAY_MAX_DELAY = 300
+QUEUED_COMMAND_MAX_AGE = timedelta(hours=6)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -60,6 +89,22 @@ class SharpCocoroAirCoordinator(DataUpdateCoordinator[dict[str, Device]]):
             config_entry.data[CONF_PASSWORD],
             session=session,
         )
+        self.read_timeout: float = config_entry.options.get(
+            CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT
+        )
+        self.command_timeout: float = config_entry.options.get(
+            CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT
+        )
+        self.hedge_reads: bool = config_entry.options.get(
+            CONF_HEDGE_READS, DEFAULT_HEDGE_READS
+        )
+        self.latency = LatencyTracker()
+        self.command_queue: CommandQueue | None = None
+        if config_entry.options.get(CONF_COMMAND_QUEUE, DEFAULT_COMMAND_QUEUE):
+            self.command_queue = CommandQueue(hass, config_entry.entry_id)
+        self._replay_task: asyncio.Task | None = None
+        # Set to cut a replay backoff short, e.g. once a poll succeeds again
+        self._replay_wakeup = asyncio.Event()
 
     async def _async_setup(self) -> None:
         """Perform initial login sequence (runs once during first refresh).
@@ -67,14 +112,16 @@ class SharpCocoroAirCoordinator(DataUpdateCoordinator[dict[str, Device]]):
         Retries on transient connection errors during HA startup when
         DNS/network may not be ready yet.
         """
+        if self.command_queue is not None:
+            await self.command_queue.async_load()
         last_err: Exception | None = None
         for attempt in range(1, STARTUP_RETRIES + 1):
             try:
-                await self.api.authenticate()
+                await self._async_authenticate()
                 return
             except SharpAuthError as err:
                 raise ConfigEntryAuthFailed("Sharp login failed") from err
-            except (SharpConnectionError, SharpApiError) as err:
+            except (SharpConnectionError, SharpApiError, TimeoutError) as err:
                 last_err = err
                 if attempt < STARTUP_RETRIES:
                     _LOGGER.warning(
@@ -87,34 +134,296 @@ class SharpCocoroAirCoordinator(DataUpdateCoordinator[dict[str, Device]]):
     async def _async_update_data(self) -> dict[str, Device]:
         """Fetch device data from Sharp cloud API."""
         try:
-            devices = await self.api.get_devices()
+            devices = await self._async_get_devices()
         except SharpAuthError:
             # Session expired — attempt automatic re-login
             _LOGGER.info("Sharp session expired, attempting re-login")
             try:
-                await self.api.authenticate()
-                devices = await self.api.get_devices()
+                await self._async_authenticate()
+                devices = await self._async_get_devices()
             except SharpAuthError as err:
                 raise ConfigEntryAuthFailed("Re-login failed") from err
             except SharpConnectionError as err:
                 raise UpdateFailed(
                     f"Error communicating with Sharp cloud: {err}"
                 ) from err
+            except TimeoutError as err:
+                raise UpdateFailed("Timed out talking to Sharp cloud") from err
         except SharpConnectionError as err:
             raise UpdateFailed(
                 f"Error communicating with Sharp cloud: {err}"
             ) from err
+        except TimeoutError as err:
+            raise UpdateFailed("Timed out talking to Sharp cloud") from err
 
+        if self.command_queue is not None and self.command_queue.device_ids():
+            self._async_schedule_replay()
         return {dev.device_id: dev for dev in devices}
 
-    async def _async_control(self, fn, *args) -> None:
-        """Run a control command with error handling."""
+    async def _async_timed(
+        self, operation: str, fn: Callable[..., Awaitable], *args,
+    ):
+        """Await a library call and record its duration.
+
+        Calls cancelled by a deadline or a winning hedge are recorded too,
+        so the tracked percentiles include the slow tail.
+        """
+        start = time.monotonic()
+        try:
+            result = await fn(*args)
+        except asyncio.CancelledError:
+            self.latency.record_cancelled(operation, time.monotonic() - start)
+            raise
+        self.latency.record(operation, time.monotonic() - start)
+        return result
+
+    async def _async_authenticate(self) -> None:
+        """Log in to the Sharp cloud within the read deadline."""
+        async with asyncio.timeout(self.read_timeout):
+            await self._async_timed("authenticate", self.api.authenticate)
+
+    async def _async_get_devices(self) -> list[Device]:
+        """Fetch the device list within the read deadline.
+
+        The deadline covers all attempts together, bounding how long a
+        refresh can take. Each attempt gets an equal share of it, so a hung
+        request is cut off and, like a connection error, retried up to
+        READ_RETRIES times with jittered backoff.
+        """
+        async with asyncio.timeout(self.read_timeout):
+            attempt = 0
+            while True:
+                try:
+                    async with asyncio.timeout(self._read_attempt_timeout):
+                        if self.hedge_reads:
+                            return await self._async_hedged(
+                                "get_devices", self.api.get_devices
+                            )
+                        return await self._async_timed(
+                            "get_devices", self.api.get_devices
+                        )
+                except (SharpConnectionError, TimeoutError) as err:
+                    if attempt >= READ_RETRIES:
+                        raise
+                    delay = random.uniform(0, READ_RETRY_BASE_DELAY * 2**attempt)
+                    attempt += 1
+                    _LOGGER.debug(
+                        "Sharp device list attempt %d/%d failed: %r, "
+                        "retrying in %.1fs",
+                        attempt, READ_RETRIES + 1, err, delay,
+                    )
+                    await asyncio.sleep(delay)
+
+    @property
+    def _read_attempt_timeout(self) -> float:
+        """Return the deadline of a single device list attempt."""
+        return self.read_timeout / (READ_RETRIES + 1)
+
+    def _hedge_delay(self, operation: str) -> float:
+        """Return how long to wait on a read before sending a hedge.
+
+        Uses the observed tail latency once enough samples exist, capped
+        at half the attempt deadline so the hedged request has time to
+        finish.
+        """
+        cap = self._read_attempt_timeout / 2
+        if self.latency.count(operation) < HEDGE_MIN_SAMPLES:
+            return cap
+        observed = self.latency.percentile(operation, HEDGE_PERCENTILE)
+        return cap if observed is None else min(observed, cap)
+
+    async def _async_hedged(
+        self, operation: str, fn: Callable[..., Awaitable], *args,
+    ):
+        """Run an idempotent read, hedging with a second call if it is slow.
+
+        Returns the first successful result and cancels the other call.
+        """
+        pending = {asyncio.create_task(self._async_timed(operation, fn, *args))}
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self._hedge_delay(operation)
+            )
+            if not done:
+                _LOGGER.debug("Sharp %s is slow, sending hedged request", operation)
+                pending.add(
+                    asyncio.create_task(self._async_timed(operation, fn, *args))
+                )
+            first_err: BaseException | None = None
+            while True:
+                for task in done:
+                    if (err := task.exception()) is None:
+                        return task.result()
+                    if isinstance(err, SharpAuthError):
+                        raise err
+                    first_err = first_err or err
+                if not pending:
+                    assert first_err is not None
+                    raise first_err
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _async_control(self, fn, device: Device, *args) -> bool:
+        """Run a control command with a deadline and error handling.
+
+        With the command queue enabled, a command that cannot reach the
+        cloud is queued for replay instead of failing. Returns True if
+        the command was sent, False if it was queued.
+        """
+        queue = self.command_queue
+        if queue is not None and queue.pending(device.device_id):
+            # Stay behind commands already waiting so replay keeps order
+            self._async_enqueue(device, fn.__name__, args, "commands pending")
+            return False
+        if queue is not None and not self.last_update_success:
+            self._async_enqueue(device, fn.__name__, args, "last poll failed")
+            return False
         try:
-            await fn(*args)
+            async with asyncio.timeout(self.command_timeout):
+                await self._async_timed(fn.__name__, fn, device, *args)
+        except TimeoutError as err:
+            if queue is None:
+                raise HomeAssistantError(
+                    f"Command timed out after {self.command_timeout}s"
+                ) from err
+            self._async_enqueue(device, fn.__name__, args, "timed out")
+            return False
         except SharpAuthError as err:
             raise ConfigEntryAuthFailed("Session expired") from err
-        except (SharpConnectionError, SharpApiError) as err:
+        except SharpConnectionError as err:
+            if queue is None:
+                raise HomeAssistantError(f"Command failed: {err}") from err
+            self._async_enqueue(device, fn.__name__, args, str(err))
+            return False
+        except SharpApiError as err:
             raise HomeAssistantError(f"Command failed: {err}") from err
+        return True
+
+    def _async_enqueue(
+        self, device: Device, command: str, args: tuple, reason: str,
+    ) -> None:
+        """Store an undelivered command and try to replay the queue."""
+        assert self.command_queue is not None
+        _LOGGER.warning(
+            "Sharp cloud unreachable (%s), queued %s for %s",
+            reason, command, device.name,
+        )
+        self.command_queue.enqueue(device.device_id, command, args)
+        self.async_update_listeners()
+        # The cloud just failed; give it the first backoff before retrying
+        self._async_schedule_replay(REPLAY_BASE_DELAY)
+
+    def _async_schedule_replay(self, initial_delay: float = 0) -> None:
+        """Start replaying queued commands.
+
+        Without an initial delay, a replay task that is backing off is
+        woken up to retry right away.
+        """
+        if self._replay_task is not None and not self._replay_task.done():
+            if not initial_delay:
+                self._replay_wakeup.set()
+            return
+        self._replay_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_replay_queue(initial_delay),
+            f"{DOMAIN} command replay",
+        )
+
+    async def _async_replay_backoff(self, wait: float) -> bool:
+        """Wait up to wait seconds; return True if woken up early."""
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(wait):
+                await self._replay_wakeup.wait()
+                return True
+        return False
+
+    async def _async_replay_queue(self, initial_delay: float) -> None:
+        """Replay queued commands until the queue is empty.
+
+        Backs off while the cloud is unreachable; a successful poll ends
+        the backoff early. Commands queued while replaying are picked up
+        before returning, including those queued during the final refresh.
+        """
+        queue = self.command_queue
+        assert queue is not None
+        delay = REPLAY_BASE_DELAY
+        self._replay_wakeup.clear()
+        if initial_delay and not await self._async_replay_backoff(initial_delay):
+            delay = min(initial_delay * 2, REPLAY_MAX_DELAY)
+        while queue.device_ids():
+            if self.data is None:
+                # Not polled yet; the first successful poll restarts replay
+                return
+            self._replay_wakeup.clear()
+            try:
+                await self._async_flush_queue(queue)
+            except SharpAuthError:
+                # Next refresh triggers reauth; replay resumes after it
+                _LOGGER.warning("Sharp session expired, pausing command replay")
+                return
+            except (SharpConnectionError, TimeoutError) as err:
+                wait = random.uniform(delay / 2, delay)
+                queue.note_failure(
+                    str(err) or "timed out",
+                    dt_util.utcnow() + timedelta(seconds=wait),
+                )
+                self.async_update_listeners()
+                _LOGGER.debug("Command replay failed: %r, retrying in %.0fs", err, wait)
+                if await self._async_replay_backoff(wait):
+                    delay = REPLAY_BASE_DELAY
+                else:
+                    delay = min(delay * 2, REPLAY_MAX_DELAY)
+                continue
+            self.async_update_listeners()
+            if not queue.device_ids():
+                await self.async_request_refresh()
+
+    async def _async_flush_queue(self, queue: CommandQueue) -> None:
+        """Send queued commands in order for every known device.
+
+        Commands older than QUEUED_COMMAND_MAX_AGE, rejected by the API or
+        meant for devices no longer on the account are dropped. Connection
+        errors and timeouts propagate so the caller can back off.
+        """
+        now = dt_util.utcnow()
+        for device_id in queue.device_ids():
+            for cmd in queue.pending(device_id):
+                if now - cmd.queued_at > QUEUED_COMMAND_MAX_AGE:
+                    _LOGGER.warning(
+                        "Dropping stale queued %s for %s (queued at %s)",
+                        cmd.command, device_id, cmd.queued_at,
+                    )
+                    queue.remove(device_id, cmd)
+        if self.data is None:
+            return
+        for device_id in queue.device_ids():
+            if (device := self.data.get(device_id)) is None:
+                _LOGGER.warning(
+                    "Dropping queued commands for %s, device no longer found",
+                    device_id,
+                )
+                for cmd in queue.pending(device_id):
+                    queue.remove(device_id, cmd)
+                continue
+            while (cmd := queue.peek(device_id)) is not None:
+                fn = getattr(self.api, cmd.command)
+                try:
+                    async with asyncio.timeout(self.command_timeout):
+                        await self._async_timed(cmd.command, fn, device, *cmd.args)
+                except (SharpAuthError, SharpConnectionError):
+                    raise
+                except SharpApiError as err:
+                    _LOGGER.warning(
+                        "Dropping queued %s for %s, rejected by Sharp cloud: %s",
+                        cmd.command, device.name, err,
+                    )
+                else:
+                    _LOGGER.info("Replayed queued %s for %s", cmd.command, device.name)
+                queue.remove(device_id, cmd)
 
     def _optimistic_update(self, device_id: str, **props) -> None:
         """Apply optimistic state update and notify entities immediately.
@@ -134,21 +443,21 @@ class SharpCocoroAirCoordinator(DataUpdateCoordinator[dict[str, Device]]):
 
     async def async_power_on(self, device: Device) -> None:
         """Turn device on."""
-        await self._async_control(self.api.power_on, device)
-        self._optimistic_update(device.device_id, power="on")
+        if await self._async_control(self.api.power_on, device):
+            self._optimistic_update(device.device_id, power="on")
 
     async def async_power_off(self, device: Device) -> None:
         """Turn device off."""
-        await self._async_control(self.api.power_off, device)
-        self._optimistic_update(device.device_id, power="off")
+        if await self._async_control(self.api.power_off, device):
+            self._optimistic_update(device.device_id, power="off")
 
     async def async_set_mode(self, device: Device, mode: str) -> None:
         """Set operation mode."""
-        await self._async_control(self.api.set_mode, device, mode)
-        display = OPERATION_MODES.get(mode, mode)
-        self._optimistic_update(device.device_id, operation_mode=display)
+        if await self._async_control(self.api.set_mode, device, mode):
+            display = OPERATION_MODES.get(mode, mode)
+            self._optimistic_update(device.device_id, operation_mode=display)
 
     async def async_set_humidify(self, device: Device, on: bool) -> None:
         """Toggle humidification."""
-        await self._async_control(self.api.set_humidify, device, on)
-        self._optimistic_update(device.device_id, humidify=on)
+        if await self._async_control(self.api.set_humidify, device, on):
+            self._optimistic_update(device.device_id, humidify=on)
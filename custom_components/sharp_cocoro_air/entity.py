@@ -16,6 +16,8 @@ class SharpCocoroAirEntity(CoordinatorEntity[SharpCocoroAirCoordinator]):
     """Base entity for Sharp COCORO Air devices."""
 
     _attr_has_entity_name = True
+    # Stay available through cloud outages when commands can be queued
+    _available_while_queueing = False
 
     def __init__(self, coordinator: SharpCocoroAirCoordinator, device_id: str) -> None:
         super().__init__(coordinator)
@@ -48,5 +50,15 @@ class SharpCocoroAirEntity(CoordinatorEntity[SharpCocoroAirCoordinator]):
 
     @property
     def available(self) -> bool:
-        """Return True if the device is in coordinator data."""
+        """Return True if the device is in coordinator data.
+
+        With the command queue enabled, entities that send commands keep
+        using the last known data while polls fail, so service calls made
+        during an outage reach the queue.
+        """
+        if (
+            self._available_while_queueing
+            and self.coordinator.command_queue is not None
+        ):
+            return self._device_id in (self.coordinator.data or {})
         return super().available and self._device_id in self.coordinator.data
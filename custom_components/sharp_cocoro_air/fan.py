@@ -37,6 +37,7 @@ class SharpAirPurifierFan(SharpCocoroAirEntity, FanEntity):
         | FanEntityFeature.PRESET_MODE
     )
     _attr_translation_key = "air_purifier"
+    _available_while_queueing = True
 
     def __init__(
         self, coordinator: SharpCocoroAirCoordinator, device_id: str,
@@ -0,0 +1,63 @@
+"""Rolling latency statistics for Sharp cloud calls."""
+from __future__ import annotations
+
+import math
+from collections import deque
+
+LATENCY_WINDOW = 100
+PERCENTILES = (50, 90, 95, 99)
+
+
+class LatencyTracker:
+    """Keep the most recent call durations per operation.
+
+    Durations are stored in seconds; percentiles use the nearest-rank
+    method over the rolling window. Calls cut off by a deadline or a
+    winning hedge count with the time they had run when cancelled, so
+    the upper percentiles reflect the real tail.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._cancelled: dict[str, int] = {}
+
+    def record(self, operation: str, seconds: float) -> None:
+        """Add a completed call duration for an operation."""
+        samples = self._samples.get(operation)
+        if samples is None:
+            samples = self._samples[operation] = deque(maxlen=self._window)
+        samples.append(seconds)
+
+    def record_cancelled(self, operation: str, seconds: float) -> None:
+        """Add the elapsed time of a call cancelled before it completed."""
+        self.record(operation, seconds)
+        self._cancelled[operation] = self._cancelled.get(operation, 0) + 1
+
+    def count(self, operation: str) -> int:
+        """Return the number of samples held for an operation."""
+        return len(self._samples.get(operation, ()))
+
+    def percentile(self, operation: str, pct: float) -> float | None:
+        """Return the pct-th percentile duration, or None without samples."""
+        samples = self._samples.get(operation)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> dict[str, dict[str, float | int]]:
+        """Return percentiles in milliseconds and cancel counts, keyed by operation."""
+        result: dict[str, dict[str, float | int]] = {}
+        for operation in sorted(self._samples):
+            stats: dict[str, float | int] = {
+                "samples": self.count(operation),
+                "cancelled": self._cancelled.get(operation, 0),
+            }
+            for pct in PERCENTILES:
+                value = self.percentile(operation, pct)
+                if value is not None:
+                    stats[f"p{pct}_ms"] = round(value * 1000, 1)
+            result[operation] = stats
+        return result
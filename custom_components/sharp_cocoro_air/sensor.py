@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -13,13 +14,18 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfEnergy,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .const import DOMAIN
 from .coordinator import SharpCocoroAirCoordinator
 from .entity import SharpCocoroAirEntity
 
@@ -31,6 +37,23 @@ class SharpSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[dict], float | str | None]
 
 
+@dataclass(frozen=True, kw_only=True)
+class SharpDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a Sharp sensor reporting integration state, not device data."""
+
+    value_fn: Callable[[SharpCocoroAirCoordinator, str], float | str | None]
+    attrs_fn: Callable[[SharpCocoroAirCoordinator, str], dict[str, Any]]
+    exists_fn: Callable[[SharpCocoroAirCoordinator], bool] = lambda _: True
+
+
+@dataclass(frozen=True, kw_only=True)
+class SharpAccountSensorEntityDescription(SensorEntityDescription):
+    """Describes a Sharp sensor reporting state of the whole account."""
+
+    value_fn: Callable[[SharpCocoroAirCoordinator], float | str | None]
+    attrs_fn: Callable[[SharpCocoroAirCoordinator], dict[str, Any]]
+
+
 def _prop(key: str) -> Callable[[dict], float | str | None]:
     """Simple property getter."""
     return lambda props: props.get(key)
@@ -126,6 +149,63 @@ SENSOR_DESCRIPTIONS: tuple[SharpSensorEntityDescription, ...] = (
 )
 
 
+def _cloud_latency_p95(coordinator: SharpCocoroAirCoordinator) -> float | None:
+    """Return p95 of device list requests in milliseconds."""
+    p95 = coordinator.latency.percentile("get_devices", 95)
+    return round(p95 * 1000, 1) if p95 is not None else None
+
+
+def _queue_length(
+    coordinator: SharpCocoroAirCoordinator, device_id: str,
+) -> int | None:
+    """Return the number of commands waiting for replay."""
+    if (queue := coordinator.command_queue) is None:
+        return None
+    return len(queue.pending(device_id))
+
+
+def _queue_attrs(
+    coordinator: SharpCocoroAirCoordinator, device_id: str,
+) -> dict[str, Any]:
+    """Return queued commands and replay status."""
+    if (queue := coordinator.command_queue) is None:
+        return {}
+    next_retry = queue.next_retry(device_id)
+    return {
+        "commands": [cmd.as_dict() for cmd in queue.pending(device_id)],
+        "last_error": queue.last_error(device_id),
+        "next_retry": next_retry.isoformat() if next_retry else None,
+    }
+
+
+ACCOUNT_SENSOR_DESCRIPTIONS: tuple[SharpAccountSensorEntityDescription, ...] = (
+    SharpAccountSensorEntityDescription(
+        key="cloud_latency",
+        translation_key="cloud_latency",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-outline",
+        value_fn=_cloud_latency_p95,
+        attrs_fn=lambda coordinator: coordinator.latency.summary(),
+    ),
+)
+
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[SharpDiagnosticSensorEntityDescription, ...] = (
+    SharpDiagnosticSensorEntityDescription(
+        key="command_queue",
+        translation_key="command_queue",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:tray-full",
+        value_fn=_queue_length,
+        attrs_fn=_queue_attrs,
+        exists_fn=lambda coordinator: coordinator.command_queue is not None,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -138,6 +218,16 @@ async def async_setup_entry(
         for device_id in coordinator.data
         for description in SENSOR_DESCRIPTIONS
     )
+    async_add_entities(
+        SharpDiagnosticSensor(coordinator, device_id, description)
+        for device_id in coordinator.data
+        for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
+        if description.exists_fn(coordinator)
+    )
+    async_add_entities(
+        SharpAccountSensor(coordinator, description)
+        for description in ACCOUNT_SENSOR_DESCRIPTIONS
+    )
 
 
 class SharpSensor(SharpCocoroAirEntity, SensorEntity):
@@ -158,3 +248,66 @@ class SharpSensor(SharpCocoroAirEntity, SensorEntity):
     @property
     def native_value(self) -> float | str | None:
         return self.entity_description.value_fn(self.device_properties)
+
+
+class SharpDiagnosticSensor(SharpCocoroAirEntity, SensorEntity):
+    """Diagnostic sensor exposing integration state for a device."""
+
+    entity_description: SharpDiagnosticSensorEntityDescription
+    _available_while_queueing = True
+
+    def __init__(
+        self,
+        coordinator: SharpCocoroAirCoordinator,
+        device_id: str,
+        description: SharpDiagnosticSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, device_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{device_id}_{description.key}"
+
+    @property
+    def native_value(self) -> float | str | None:
+        return self.entity_description.value_fn(
+            self.coordinator, self._device_id
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.entity_description.attrs_fn(self.coordinator, self._device_id)
+
+
+class SharpAccountSensor(CoordinatorEntity[SharpCocoroAirCoordinator], SensorEntity):
+    """Sensor for the Sharp cloud account, grouped under a service device."""
+
+    entity_description: SharpAccountSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: SharpCocoroAirCoordinator,
+        description: SharpAccountSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        entry = coordinator.config_entry
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="Sharp",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True; the statistics are kept locally, even while polls fail."""
+        return True
+
+    @property
+    def native_value(self) -> float | str | None:
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.entity_description.attrs_fn(self.coordinator)
@@ -30,6 +30,7 @@ class SharpHumidificationSwitch(SharpCocoroAirEntity, SwitchEntity):
 
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_translation_key = "humidification"
+    _available_while_queueing = True
 
     def __init__(
         self, coordinator: SharpCocoroAirCoordinator, device_id: str,